@@ -16,31 +16,182 @@ Date: 2025
 Version: 1.0
 """
 
-from fastapi import FastAPI, HTTPException, status
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from fastapi import APIRouter, FastAPI, HTTPException, Query, Request, status
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.coder import Coder
+from fastapi_cache.decorator import cache
+from fastapi_cache.key_builder import default_key_builder
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Callable, Optional, List, Dict, Tuple
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import count, islice
+import hashlib
+import orjson
+
+# Cache namespace shared by the book list endpoints; cleared on every write
+BOOKS_CACHE_NAMESPACE = "books"
+
+# Generation of the book data, bumped on every write. Handlers never await
+# in the middle of a change, so readers always see a consistent state; the
+# generation also goes into every cache key, so a response computed before a
+# write but stored after it (the cache backend awaits a lock) is never served
+_BOOKS_VERSION: int = 0
+
+
+def _books_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """
+    Build the default fastapi-cache2 key, tagged with the current data generation.
+    """
+    cache_key = default_key_builder(
+        func, namespace, request=request, response=response, args=args, kwargs=kwargs
+    )
+    return f"{cache_key}:v{_BOOKS_VERSION}"
+
+
+class ORJSONCoder(Coder):
+    """
+    fastapi-cache2 coder that stores responses as orjson-encoded bytes.
+    
+    The default JsonCoder falls back to FastAPI's pure-Python
+    jsonable_encoder for every book on a cache miss.
+    """
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    @classmethod
+    def decode(cls, value: bytes) -> Any:
+        return orjson.loads(value)
+
+
+# In-memory response cache for the GET endpoints, set up at import time so
+# the cached routes work however the app is started (no lifespan needed)
+FastAPICache.init(
+    InMemoryBackend(),
+    coder=ORJSONCoder,
+    key_builder=_books_key_builder
+)
+
+# OpenAPI schema, encoded on the first /openapi.json request and served as-is
+OPENAPI_BYTES: bytes = b""
+
 
 # Initialize FastAPI application
 app = FastAPI(
     title="Book Management API",
     description="A simple API to manage a collection of books",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,  # Serialize responses with orjson
+    # The schema and docs pages are served by routes of our own (see below)
+    # so the schema is not re-encoded on every /openapi.json request
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None
 )
 
-# In-memory database - list of books stored as dictionaries
-# In a production app, this would be replaced with a real database
-BOOKS: List[dict] = [
-    {"id": 1, "title": "1984", "author": "George Orwell", "category": "Fiction"},
-    {"id": 2, "title": "To Kill a Mockingbird", "author": "Harper Lee", "category": "Fiction"},
-    {"id": 3, "title": "The Great Gatsby", "author": "F. Scott Fitzgerald", "category": "Fiction"},
-    {"id": 4, "title": "Pride and Prejudice", "author": "Jane Austen", "category": "Romance"},
-    {"id": 5, "title": "The Catcher in the Rye", "author": "J.D. Salinger", "category": "Fiction"},
+
+@dataclass(slots=True)
+class BookRow:
+    """
+    A book as stored in the in-memory database.
+    
+    A slotted dataclass uses far less memory than a dict per book and its
+    attributes are read directly from slots instead of by key hashing.
+    orjson and FastAPI both serialize dataclasses natively.
+    
+    The lowercased author and category are stored alongside so searches
+    never lowercase stored strings per request. They are set in
+    __post_init__ and must be refreshed whenever author or category change;
+    orjson skips underscore-prefixed fields and the list routes serialize
+    through the Book model, so they never show up in responses.
+    
+    Attributes:
+        id: Unique book identifier
+        title: The title of the book
+        author: The author's name
+        category: The book's category/genre
+    """
+    id: int
+    title: str
+    author: str
+    category: str
+    _author_lc: str = field(init=False, repr=False, compare=False)
+    _category_lc: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._author_lc = self.author.lower()
+        self._category_lc = self.category.lower()
+
+
+# Starting book records, loaded into the in-memory database below
+SEED_BOOKS: List[BookRow] = [
+    BookRow(id=1, title="1984", author="George Orwell", category="Fiction"),
+    BookRow(id=2, title="To Kill a Mockingbird", author="Harper Lee", category="Fiction"),
+    BookRow(id=3, title="The Great Gatsby", author="F. Scott Fitzgerald", category="Fiction"),
+    BookRow(id=4, title="Pride and Prejudice", author="Jane Austen", category="Romance"),
+    BookRow(id=5, title="The Catcher in the Rye", author="J.D. Salinger", category="Fiction"),
 ]
 
+# In-memory database - book records keyed by ID
+# Dicts keep insertion order, so this doubles as the ordered book list while
+# giving O(1) lookups and deletes (a list needs an O(N) scan to remove)
+# A list kept sorted by ID with bisect lookups would save the hash table, but
+# clients may pick their own IDs, so inserting could cost O(N) element moves
+# In a production app, this would be replaced with a real database
+# Books are only added and removed through _index_book() and _unindex_book()
+BOOKS_BY_ID: Dict[int, BookRow] = {}
+
+# Highest book ID handed out so far, so new IDs don't need a scan of the books
+_MAX_ID: int = max((book.id for book in SEED_BOOKS), default=0)
+
+# Position of each book in BOOKS_BY_ID, fixed when the book is added
+BOOK_POSITION: Dict[int, int] = {}
+_NEXT_POSITION = count()
+
+# Index of books by lowercased category, so category lookups skip the scan
+# Each bucket is keyed by book ID: ordered like BOOKS_BY_ID, with O(1) removal
+CATEGORY_INDEX: Dict[str, Dict[int, BookRow]] = defaultdict(dict)
+
 
 # Pydantic Models for Request/Response Validation
 # ===============================================
 
+class Book(BaseModel):
+    """
+    Complete book model with all fields (API response schema).
+    
+    Declaring it as the list endpoints' response_model lets Pydantic's
+    compiled core validate and serialize the books, instead of FastAPI's
+    generic jsonable_encoder. from_attributes lets it read BookRow records
+    directly, and it never exposes their lowercased internals.
+    
+    Attributes:
+        id: Unique book identifier
+        title: The title of the book
+        author: The author's name
+        category: The book's category/genre
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    author: str
+    category: str
+
+
 class BookCreate(BaseModel):
     """
     Model for creating a new book.
@@ -92,43 +243,194 @@ class BookUpdate(BaseModel):
         }
 
 
+# Index Helpers
+# =============
+
+def _index_book(book: BookRow) -> None:
+    """
+    Add a book to the database and every index.
+    
+    Args:
+        book (BookRow): The book to add
+    """
+    BOOKS_BY_ID[book.id] = book
+    BOOK_POSITION[book.id] = next(_NEXT_POSITION)
+    _add_to_category(book)
+
+
+def _unindex_book(book: BookRow) -> None:
+    """
+    Remove a book from the database and every index.
+    
+    Args:
+        book (BookRow): The book to remove
+    """
+    del BOOKS_BY_ID[book.id]
+    _remove_from_category(book)
+    del BOOK_POSITION[book.id]
+
+
+def _add_to_category(book: BookRow) -> None:
+    """
+    Add a book to the bucket of its current category, at its position in
+    the collection.
+    
+    New books always go last; only a book moving between categories can
+    land mid-bucket, and then the bucket is rebuilt in order.
+    
+    Args:
+        book (BookRow): The book to add
+    """
+    bucket = CATEGORY_INDEX[book._category_lc]
+    if bucket and BOOK_POSITION[next(reversed(bucket))] > BOOK_POSITION[book.id]:
+        books = sorted([*bucket.values(), book], key=lambda b: BOOK_POSITION[b.id])
+        bucket.clear()
+        bucket.update((b.id, b) for b in books)
+    else:
+        bucket[book.id] = book
+
+
+def _remove_from_category(book: BookRow) -> None:
+    """
+    Remove a book from its category bucket, dropping the bucket once empty.
+    
+    Args:
+        book (BookRow): The book to remove (indexed under its current category)
+    """
+    key = book._category_lc
+    bucket = CATEGORY_INDEX[key]
+    del bucket[book.id]
+    if not bucket:
+        del CATEGORY_INDEX[key]
+
+
+@lru_cache(maxsize=1024)
+def _search_author(query: str) -> Tuple[BookRow, ...]:
+    """
+    Find the books whose author name contains a lowercased query.
+    
+    Substring matches can't be answered by a hash index, so this scans the
+    stored lowercased author names once per distinct query, in the same
+    order as BOOKS_BY_ID. Results are memoized per query, so differently-cased
+    URLs for the same search share one result. The tuple can't be mutated by
+    callers; the memo is cleared by _invalidate_book_caches() on every write.
+    
+    Args:
+        query (str): The lowercased author name or partial name
+    
+    Returns:
+        Tuple[BookRow, ...]: The matching books, in collection order
+    """
+    return tuple(
+        book for book in BOOKS_BY_ID.values()
+        if query in book._author_lc
+    )
+
+
+async def _invalidate_book_caches() -> None:
+    """
+    Drop every cached book search and list response after a write.
+    """
+    global _BOOKS_VERSION
+    
+    # Bump first, so any response still being computed is stored under a stale key
+    _BOOKS_VERSION += 1
+    _search_author.cache_clear()
+    await FastAPICache.clear(namespace=BOOKS_CACHE_NAMESPACE)
+
+
+for _book in SEED_BOOKS:
+    _index_book(_book)
+
+
 # API Endpoints
 # =============
+#
+# Every handler is `async def` on purpose. None of them do I/O, and thanks to
+# the indexes above each one is a dict lookup or a cached list, so running
+# them on the event loop is cheaper than handing them to the threadpool that
+# FastAPI uses for plain `def` handlers. Keeping reads and writes on the one
+# event-loop thread also means a reader can never see the indexes while a
+# writer is halfway through updating them.
+
+# The root response never changes, so encode it once at import time along with
+# an ETag that lets clients and proxies revalidate it cheaply
+ROOT_RESPONSE_BYTES: bytes = orjson.dumps({
+    "message": "Welcome to the Book Management API",
+    "documentation": "/docs",
+    "version": "1.0.0"
+})
+ROOT_ETAG: str = f'"{hashlib.sha256(ROOT_RESPONSE_BYTES).hexdigest()[:16]}"'
+
 
 @app.get("/", tags=["Root"])
-async def root() -> dict:
+async def root(request: Request) -> Response:
     """
     Root endpoint - Welcome message and API information.
     
+    Args:
+        request (Request): The incoming request (read for If-None-Match)
+    
     Returns:
-        dict: Welcome message with API documentation link
+        Response: Pre-encoded JSON welcome message with API documentation link,
+                  or an empty 304 Not Modified if the client's copy is current
     """
-    return {
-        "message": "Welcome to the Book Management API",
-        "documentation": "/docs",
-        "version": "1.0.0"
-    }
+    # A client that already holds this version only needs a 304, not the body
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_etags = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+        if "*" in client_etags or ROOT_ETAG in client_etags:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": ROOT_ETAG}
+            )
+    
+    return Response(
+        content=ROOT_RESPONSE_BYTES,
+        media_type="application/json",
+        headers={"ETag": ROOT_ETAG}
+    )
 
 
-@app.get("/books/", tags=["Books"], response_model=List[dict])
-async def get_all_books() -> List[dict]:
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_schema() -> Response:
     """
-    Retrieve all books in the collection.
+    Serve the OpenAPI schema, encoding it only on the first request.
     
-    Returns:
-        List[dict]: A list of all books with their details
+    Built lazily rather than at import time so the schema covers every
+    route, including the ones registered further down this module.
+    """
+    global OPENAPI_BYTES
     
-    Example Response:
-        [
-            {"id": 1, "title": "1984", "author": "George Orwell", "category": "Fiction"},
-            ...
-        ]
+    if not OPENAPI_BYTES:
+        OPENAPI_BYTES = orjson.dumps(app.openapi())
+    return Response(content=OPENAPI_BYTES, media_type="application/json")
+
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui() -> HTMLResponse:
+    """
+    Interactive API documentation (Swagger UI).
     """
-    return BOOKS
+    return get_swagger_ui_html(openapi_url="/openapi.json", title=f"{app.title} - Swagger UI")
 
 
-@app.get("/books/{book_id}", tags=["Books"])
-async def get_book_by_id(book_id: int) -> dict:
+@app.get("/redoc", include_in_schema=False)
+async def redoc() -> HTMLResponse:
+    """
+    Alternative API documentation (ReDoc).
+    """
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc")
+
+
+# Book endpoints, all mounted under /books
+# Starlette tries routes in registration order, so the most frequently hit
+# route (a single book by ID) is registered first
+router = APIRouter(prefix="/books", tags=["Books"])
+
+
+@router.get("/{book_id}", responses={status.HTTP_200_OK: {"model": Book}})
+async def get_book_by_id(book_id: int) -> ORJSONResponse:
     """
     Retrieve a specific book by its ID.
     
@@ -136,7 +438,7 @@ async def get_book_by_id(book_id: int) -> dict:
         book_id (int): The unique identifier of the book (path parameter)
     
     Returns:
-        dict: The book details if found
+        ORJSONResponse: The book details if found
     
     Raises:
         HTTPException: 404 error if book is not found
@@ -145,20 +447,59 @@ async def get_book_by_id(book_id: int) -> dict:
         GET /books/1
         Returns: {"id": 1, "title": "1984", "author": "George Orwell", "category": "Fiction"}
     """
-    # Search through all books for matching ID
-    for book in BOOKS:
-        if book["id"] == book_id:
-            return book
+    # Look up the book directly in the ID index
+    book = BOOKS_BY_ID.get(book_id)
     
     # If no book found, raise 404 error
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Book with ID {book_id} not found"
-    )
+    if book is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Book with ID {book_id} not found"
+        )
+    
+    # Return the stored record directly, skipping FastAPI's jsonable_encoder
+    return ORJSONResponse(content=book)
+
+
+@router.get("/", response_model=List[Book])
+@cache(expire=60, namespace=BOOKS_CACHE_NAMESPACE)
+async def get_all_books(
+    skip: int = Query(0, ge=0, description="Number of books to skip"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of books to return (all if omitted)")
+) -> List[BookRow]:
+    """
+    Retrieve all books in the collection, optionally one page at a time.
+    
+    Args:
+        skip (int): Number of books to skip (query parameter, default 0)
+        limit (Optional[int]): Maximum number of books to return (query parameter)
+    
+    Returns:
+        List[BookRow]: A list of books with their details
+    
+    Notes:
+        - Large collections should be fetched in pages, so that no single
+          response has to hold (and encode) every book at once
+    
+    Example Response:
+        [
+            {"id": 1, "title": "1984", "author": "George Orwell", "category": "Fiction"},
+            ...
+        ]
+    """
+    books = BOOKS_BY_ID.values()
+    
+    # Slice lazily, so a page only touches the books it returns (plus those skipped)
+    if skip or limit is not None:
+        stop = None if limit is None else skip + limit
+        return list(islice(books, skip, stop))
+    
+    return list(books)
 
 
-@app.get("/books/category/{category}", tags=["Books"])
-async def get_books_by_category(category: str) -> List[dict]:
+@router.get("/category/{category}", response_model=List[Book])
+@cache(expire=60, namespace=BOOKS_CACHE_NAMESPACE)
+async def get_books_by_category(category: str) -> List[BookRow]:
     """
     Retrieve all books in a specific category.
     
@@ -166,24 +507,21 @@ async def get_books_by_category(category: str) -> List[dict]:
         category (str): The category to filter by (path parameter, case-insensitive)
     
     Returns:
-        List[dict]: A list of books in the specified category
+        List[BookRow]: A list of books in the specified category
     
     Example:
         GET /books/category/Fiction
         Returns all books with category "Fiction"
     """
-    # Filter books by category (case-insensitive comparison)
-    filtered_books = [
-        book for book in BOOKS 
-        if book["category"].lower() == category.lower()
-    ]
-    
+    # Look up the category bucket (keys are stored lowercased)
     # Return empty list if no books found in this category
-    return filtered_books
+    bucket = CATEGORY_INDEX.get(category.lower())
+    return list(bucket.values()) if bucket else []
 
 
-@app.get("/books/author/{author_name}", tags=["Books"])
-async def search_books_by_author(author_name: str) -> List[dict]:
+@router.get("/author/{author_name}", response_model=List[Book])
+@cache(expire=60, namespace=BOOKS_CACHE_NAMESPACE)
+async def search_books_by_author(author_name: str) -> Tuple[BookRow, ...]:
     """
     Search for books by author name (partial match supported).
     
@@ -191,23 +529,22 @@ async def search_books_by_author(author_name: str) -> List[dict]:
         author_name (str): The author name or partial name to search for (case-insensitive)
     
     Returns:
-        List[dict]: A list of books by authors matching the search term
+        Tuple[BookRow, ...]: The books by authors matching the search term
     
     Example:
         GET /books/author/orwell
         Returns: [{"id": 1, "title": "1984", "author": "George Orwell", "category": "Fiction"}]
     """
-    # Search for books where author name contains the search term
-    matching_books = [
-        book for book in BOOKS 
-        if author_name.lower() in book["author"].lower()
-    ]
-    
-    return matching_books
+    # Lowercase once so the memoized search is shared across casings
+    return _search_author(author_name.lower())
 
 
-@app.post("/books/", tags=["Books"], status_code=status.HTTP_201_CREATED)
-async def create_book(new_book: BookCreate) -> dict:
+@router.post(
+    "/",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": Book}}
+)
+async def create_book(new_book: BookCreate) -> ORJSONResponse:
     """
     Create a new book and add it to the collection.
     
@@ -215,11 +552,14 @@ async def create_book(new_book: BookCreate) -> dict:
         new_book (BookCreate): The book data to create (from request body)
     
     Returns:
-        dict: The newly created book with all its details
+        ORJSONResponse: The newly created book with all its details
+    
+    Raises:
+        HTTPException: 409 error if a book with the given ID already exists
     
     Notes:
         - If no ID is provided or ID is 0, a new ID will be auto-generated
-        - The new ID will be one more than the current maximum ID
+        - The new ID will be one more than the highest ID used so far
     
     Example Request Body:
         {
@@ -228,21 +568,36 @@ async def create_book(new_book: BookCreate) -> dict:
             "category": "Fantasy"
         }
     """
+    global _MAX_ID
+    
     # Auto-generate ID if not provided or if it's 0
     if new_book.id is None or new_book.id == 0:
-        # Find the maximum ID currently in use and add 1
-        max_id = max([book["id"] for book in BOOKS], default=0)
-        new_book.id = max_id + 1
-    
-    # Convert Pydantic model to dictionary and add to books list
-    book_dict = new_book.model_dump()
-    BOOKS.append(book_dict)
-    
-    return book_dict
-
-
-@app.put("/books/{book_id}", tags=["Books"])
-async def update_book(book_id: int, updated_book: BookUpdate) -> dict:
+        # Bump the running maximum ID instead of scanning all books
+        _MAX_ID += 1
+        new_book.id = _MAX_ID
+    elif new_book.id in BOOKS_BY_ID:
+        # IDs must stay unique for the ID index to be correct
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Book with ID {new_book.id} already exists"
+        )
+    else:
+        # Keep the running maximum ahead of any client-supplied ID
+        _MAX_ID = max(_MAX_ID, new_book.id)
+    
+    # Convert Pydantic model to a book record and add it to the database and indexes
+    book_row = BookRow(**new_book.model_dump())
+    _index_book(book_row)
+    
+    # The cached book lists and searches are now stale
+    await _invalidate_book_caches()
+    
+    # Responses returned directly don't pick up the decorator's status code
+    return ORJSONResponse(content=book_row, status_code=status.HTTP_201_CREATED)
+
+
+@router.put("/{book_id}", responses={status.HTTP_200_OK: {"model": Book}})
+async def update_book(book_id: int, updated_book: BookUpdate) -> ORJSONResponse:
     """
     Update an existing book's information.
     
@@ -251,7 +606,7 @@ async def update_book(book_id: int, updated_book: BookUpdate) -> dict:
         updated_book (BookUpdate): The fields to update (from request body)
     
     Returns:
-        dict: The updated book with all its details
+        ORJSONResponse: The updated book with all its details
     
     Raises:
         HTTPException: 404 error if book is not found
@@ -267,30 +622,46 @@ async def update_book(book_id: int, updated_book: BookUpdate) -> dict:
             "category": "Dystopian Fiction"
         }
     """
-    # Search for the book to update
-    for book in BOOKS:
-        if book["id"] == book_id:
-            # Update only the fields that were provided (not None)
-            if updated_book.title is not None:
-                book["title"] = updated_book.title
-            
-            if updated_book.author is not None:
-                book["author"] = updated_book.author
-            
-            if updated_book.category is not None:
-                book["category"] = updated_book.category
-            
-            return book
+    # Look up the book to update
+    book = BOOKS_BY_ID.get(book_id)
     
     # If book not found, raise 404 error
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Book with ID {book_id} not found"
+    if book is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Book with ID {book_id} not found"
+        )
+    
+    # Only the fields that were provided (not None) are updated
+    patch = updated_book.model_dump(exclude_none=True)
+    
+    # Take the book out of the category bucket it is about to leave
+    category_moved = (
+        "category" in patch and patch["category"].lower() != book._category_lc
     )
+    if category_moved:
+        _remove_from_category(book)
+    
+    # The record is shared with the indexes, so they see the change too
+    for field_name, value in patch.items():
+        setattr(book, field_name, value)
+    
+    # Refresh the lowercased copies and re-index under the new category
+    if "author" in patch:
+        book._author_lc = book.author.lower()
+    if "category" in patch:
+        book._category_lc = book.category.lower()
+    if category_moved:
+        _add_to_category(book)
+    
+    # The cached book lists and searches are now stale
+    await _invalidate_book_caches()
+    
+    return ORJSONResponse(content=book)
 
 
-@app.delete("/books/{book_id}", tags=["Books"])
-async def delete_book(book_id: int) -> dict:
+@router.delete("/{book_id}")
+async def delete_book(book_id: int) -> ORJSONResponse:
     """
     Delete a book from the collection.
     
@@ -298,7 +669,7 @@ async def delete_book(book_id: int) -> dict:
         book_id (int): The ID of the book to delete (path parameter)
     
     Returns:
-        dict: Success message with deleted book details
+        ORJSONResponse: Success message with deleted book details
     
     Raises:
         HTTPException: 404 error if book is not found
@@ -307,23 +678,30 @@ async def delete_book(book_id: int) -> dict:
         DELETE /books/1
         Returns: {"message": "Book deleted successfully", "deleted_book": {...}}
     """
-    # Search for the book to delete
-    for book in BOOKS:
-        if book["id"] == book_id:
-            # Store book details before removing
-            deleted_book = book.copy()
-            BOOKS.remove(book)
-            
-            return {
-                "message": "Book deleted successfully",
-                "deleted_book": deleted_book
-            }
+    # Look up the book to delete
+    book = BOOKS_BY_ID.get(book_id)
     
     # If book not found, raise 404 error
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Book with ID {book_id} not found"
-    )
+    if book is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Book with ID {book_id} not found"
+        )
+    
+    # Drop it from the database and indexes in O(1); the record itself is
+    # returned as-is since nothing else holds on to it any more
+    _unindex_book(book)
+    
+    # The cached book lists and searches are now stale
+    await _invalidate_book_caches()
+    
+    return ORJSONResponse(content={
+        "message": "Book deleted successfully",
+        "deleted_book": book
+    })
+
+
+app.include_router(router)
 
 
 # Application Entry Point
@@ -336,13 +714,28 @@ if __name__ == "__main__":
     The server will start at: http://127.0.0.1:8000
     Interactive API documentation available at: http://127.0.0.1:8000/docs
     Alternative documentation at: http://127.0.0.1:8000/redoc
+    
+    Environment variables:
+        DEV: Set to any value to auto-reload on code changes (development only)
+        WORKERS: Number of worker processes (default 1). Every worker keeps
+                 its own in-memory copy of the books, so a book created in one
+                 worker is not visible to the others; only raise this once the
+                 books live in a shared store.
     """
+    import os
     import uvicorn
     
+    dev_mode = bool(os.getenv("DEV"))
+    
     # Start the server
+    # uvloop and httptools (from uvicorn[standard]) run the event loop and
+    # HTTP parsing in C, which is much faster than the pure-Python defaults
     uvicorn.run(
-        app,
+        "app:app",          # Import string - required for reload and workers
         host="127.0.0.1",  # localhost - only accessible from this computer
         port=8000,          # Port number
-        reload=True         # Auto-reload on code changes (for development only)
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WORKERS", "1")),
+        reload=dev_mode     # Auto-reload on code changes (for development only)
     )
\ No newline at end of file
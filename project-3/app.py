@@ -8,11 +8,14 @@ Author: Your Name
 Version: 1.0.0
 """
 
-from fastapi import FastAPI, Depends, HTTPException, Path, status
+from fastapi import FastAPI, Body, Depends, HTTPException, Path, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from database import engine, SessionLocal
 from typing import Annotated, List
+from sqlalchemy import insert, lambda_stmt, select
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 import models
 
@@ -20,13 +23,23 @@ import models
 app = FastAPI(
     title="Todo API",
     description="A professional API for managing todo items",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # Serialize responses with orjson
 )
 
+# Compress larger responses (e.g. full list endpoints). Level 1 trades a little
+# compression ratio for much less CPU per response.
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=1)
+
 # Create all database tables if they don't exist
 # This runs when the application starts
 models.Base.metadata.create_all(bind=engine)
 
+# create_all skips tables that already exist, so also add any indexes that an
+# older database file is missing
+for index in models.Todos.__table__.indexes:
+    index.create(bind=engine, checkfirst=True)
+
 
 def get_db():
     """
@@ -54,6 +67,21 @@ def get_db():
 # This makes the type annotation cleaner and more reusable
 db_dependency = Annotated[Session, Depends(get_db)]
 
+# Statement for listing all todos, built once at import time. lambda_stmt lets
+# SQLAlchemy cache the compiled SQL instead of rebuilding it on every request.
+# Selecting plain columns returns lightweight rows with no ORM hydration.
+ALL_TODOS_STMT = lambda_stmt(lambda: select(
+    models.Todos.id,
+    models.Todos.title,
+    models.Todos.description,
+    models.Todos.priority,
+    models.Todos.complete,
+))
+
+# Note: the endpoints below are plain `def` functions because the SQLAlchemy
+# session is synchronous. FastAPI runs them in its threadpool so blocking
+# database calls never stall the event loop.
+
 
 class TodoRequestModel(BaseModel):
     """
@@ -76,6 +104,9 @@ class TodoRequestModel(BaseModel):
             "complete": false
         }
     """
+    # Request bodies are read-only once validated
+    model_config = ConfigDict(extra="ignore", validate_assignment=False, frozen=True)
+
     title: str = Field(min_length=3, description="Todo title (minimum 3 characters)")
     description: str | None = Field(
         default=None, 
@@ -123,11 +154,12 @@ class TodoResponseModel(BaseModel):
 @app.get(
     "/", 
     status_code=status.HTTP_200_OK,
-    response_model=List[TodoResponseModel],
+    response_model=None,  # Rows are serialized directly; skip Pydantic
+    responses={status.HTTP_200_OK: {"model": List[TodoResponseModel]}},
     summary="Get all todos",
     description="Retrieve a list of all todo items from the database"
 )
-async def read_all(db: db_dependency):
+def read_all(db: db_dependency) -> ORJSONResponse:
     """
     Retrieve all todo items.
     
@@ -138,7 +170,7 @@ async def read_all(db: db_dependency):
         db: Database session (injected automatically)
         
     Returns:
-        List[TodoResponseModel]: List of all todo items
+        ORJSONResponse: List of all todo items (shaped like TodoResponseModel)
         
     Example Response:
         [
@@ -158,7 +190,19 @@ async def read_all(db: db_dependency):
             }
         ]
     """
-    return db.query(models.Todos).all()
+    # Column values are already typed by the database schema, so build the
+    # response dicts directly and let orjson serialize them
+    rows = db.execute(ALL_TODOS_STMT).all()
+    return ORJSONResponse([
+        {
+            "id": todo_id,
+            "title": title,
+            "description": description,
+            "priority": priority,
+            "complete": complete
+        }
+        for todo_id, title, description, priority, complete in rows
+    ])
 
 
 @app.get(
@@ -168,7 +212,7 @@ async def read_all(db: db_dependency):
     summary="Get a specific todo",
     description="Retrieve a single todo item by its ID"
 )
-async def read_todo(db: db_dependency, todo_id: int = Path(gt=0, description="The ID of the todo to retrieve")):
+def read_todo(db: db_dependency, todo_id: int = Path(gt=0, description="The ID of the todo to retrieve")):
     """
     Retrieve a single todo by ID.
     
@@ -191,10 +235,8 @@ async def read_todo(db: db_dependency, todo_id: int = Path(gt=0, description="Th
             "complete": false
         }
     """
-    # Query the database for the todo with the specified ID
-    todo_element: models.Todos | None = db.query(models.Todos).filter(
-        models.Todos.id == todo_id
-    ).first()
+    # Look up the todo by primary key (checks the identity map first)
+    todo_element: models.Todos | None = db.get(models.Todos, todo_id)
     
     # If found, return it; otherwise, raise 404 error
     if todo_element:
@@ -212,7 +254,7 @@ async def read_todo(db: db_dependency, todo_id: int = Path(gt=0, description="Th
     summary="Create a new todo",
     description="Create a new todo item with the provided data"
 )
-async def create_todo(db: db_dependency, todo_request: TodoRequestModel):
+def create_todo(db: db_dependency, todo_request: TodoRequestModel):
     """
     Create a new todo item.
     
@@ -244,16 +286,68 @@ async def create_todo(db: db_dependency, todo_request: TodoRequestModel):
         }
     """
     # Convert Pydantic model to dictionary and create SQLAlchemy model
-    todo_element = models.Todos(**todo_request.model_dump())
+    todo_data = todo_request.model_dump()
+    todo_element = models.Todos(**todo_data)
     
-    # Add to database session and commit the transaction
+    # Flush to get the generated ID from the INSERT itself, then commit.
+    # Every other column comes from the request, so no refresh SELECT is needed.
     db.add(todo_element)
+    db.flush()
+    todo_id = todo_element.id
     db.commit()
     
-    # Refresh to get the generated ID and any default values
-    db.refresh(todo_element)
+    return {"id": todo_id, **todo_data}
+
+
+@app.post(
+    "/todos/bulk", 
+    status_code=status.HTTP_201_CREATED,
+    summary="Create several todos",
+    description="Create multiple todo items in a single transaction"
+)
+def create_todos_bulk(
+    db: db_dependency,
+    todo_requests: List[TodoRequestModel] = Body(
+        min_length=1,
+        description="Todo items to create (at least one)"
+    )
+):
+    """
+    Create several todo items at once.
     
-    return todo_element
+    All items are written with one multi-row INSERT and a single commit,
+    so the transaction cost is paid once instead of once per item.
+    
+    Args:
+        db: Database session (injected automatically)
+        todo_requests: List of todo data from request body (validated automatically)
+        
+    Returns:
+        dict: Confirmation message and number of todos created
+        
+    Example Request:
+        [
+            {"title": "Buy groceries", "priority": 3},
+            {"title": "Call dentist", "priority": 5, "complete": true}
+        ]
+        
+    Example Response:
+        {
+            "message": "Todos created successfully",
+            "created": 2
+        }
+    """
+    # Insert all rows in one statement and commit once
+    db.execute(
+        insert(models.Todos),
+        [todo_request.model_dump() for todo_request in todo_requests]
+    )
+    db.commit()
+    
+    return {
+        "message": "Todos created successfully",
+        "created": len(todo_requests)
+    }
 
 
 @app.put(
@@ -263,7 +357,7 @@ async def create_todo(db: db_dependency, todo_request: TodoRequestModel):
     summary="Update a todo",
     description="Update an existing todo item with new data"
 )
-async def update_todo(
+def update_todo(
     db: db_dependency, 
     todo_request: TodoRequestModel, 
     todo_id: int = Path(gt=0, description="The ID of the todo to update")
@@ -301,10 +395,8 @@ async def update_todo(
             "complete": true
         }
     """
-    # Find the todo by ID
-    todo_element = db.query(models.Todos).filter(
-        models.Todos.id == todo_id
-    ).first()
+    # Find the todo by primary key
+    todo_element = db.get(models.Todos, todo_id)
     
     # Raise 404 if not found
     if not todo_element:
@@ -314,10 +406,9 @@ async def update_todo(
         )
 
     # Update only the fields that were provided in the request
-    # exclude_unset=True means only set fields are included
-    update_data = todo_request.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(todo_element, key, value)
+    # __pydantic_fields_set__ holds exactly the fields the client sent
+    for key in todo_request.__pydantic_fields_set__:
+        setattr(todo_element, key, getattr(todo_request, key))
 
     # Commit changes and refresh the object
     db.commit()
@@ -332,7 +423,7 @@ async def update_todo(
     summary="Delete a todo",
     description="Delete a todo item by its ID"
 )
-async def delete_todo(db: db_dependency, todo_id: int = Path(gt=0, description="The ID of the todo to delete")):
+def delete_todo(db: db_dependency, todo_id: int = Path(gt=0, description="The ID of the todo to delete")) -> ORJSONResponse:
     """
     Delete a todo item.
     
@@ -344,7 +435,7 @@ async def delete_todo(db: db_dependency, todo_id: int = Path(gt=0, description="
         todo_id: ID of the todo to delete (must be greater than 0)
         
     Returns:
-        dict: Confirmation message and deleted todo data
+        ORJSONResponse: Confirmation message and deleted todo data
         
     Raises:
         HTTPException: 404 error if todo is not found
@@ -361,10 +452,8 @@ async def delete_todo(db: db_dependency, todo_id: int = Path(gt=0, description="
             }
         }
     """
-    # Find the todo by ID
-    todo_element = db.query(models.Todos).filter(
-        models.Todos.id == todo_id
-    ).first()
+    # Find the todo by primary key
+    todo_element = db.get(models.Todos, todo_id)
     
     # Raise 404 if not found
     if not todo_element:
@@ -386,8 +475,8 @@ async def delete_todo(db: db_dependency, todo_id: int = Path(gt=0, description="
     db.delete(todo_element)
     db.commit()
 
-    # Return confirmation with deleted data
-    return {
+    # Return confirmation with deleted data, serialized directly by orjson
+    return ORJSONResponse({
         "message": "Todo deleted successfully", 
         "deleted_value": deleted_data
-    }
\ No newline at end of file
+    })
\ No newline at end of file
@@ -7,8 +7,16 @@ Base = declarative_base()
 
 SQLALCHEMY_DATABASE_URL = 'sqlite:///project3.db'
 
+# check_same_thread=False lets connections be used from FastAPI's threadpool.
+# A larger compiled-statement cache keeps SQL compilation off the hot path, and
+# pre-ping stays off since a local SQLite file never drops connections.
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={'check_same_thread': False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={'check_same_thread': False},
+    query_cache_size=4096,
+    pool_pre_ping=False,
+    pool_size=20,
+    max_overflow=0
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -6,5 +6,5 @@ class Todos(Base):
     id: Column[int] = Column(Integer, primary_key=True, index=True)
     title: Column[str] = Column(String)
     description: Column[str] = Column(String)
-    priority: Column[int] = Column(Integer)
-    complete: Column[bool] = Column(Boolean, default=False)
\ No newline at end of file
+    priority: Column[int] = Column(Integer, index=True)
+    complete: Column[bool] = Column(Boolean, default=False, index=True)
\ No newline at end of file